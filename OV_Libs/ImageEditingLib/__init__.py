@@ -10,6 +10,7 @@ from OV_Libs.ImageEditingLib.image_editing_ops import (
     extract_unique_colors,
     build_identity_mapping,
     apply_color_mapping,
+    find_colors_within_distance,
     save_images,
 )
 
@@ -19,5 +20,6 @@ __all__ = [
     "extract_unique_colors",
     "build_identity_mapping",
     "apply_color_mapping",
+    "find_colors_within_distance",
     "save_images",
 ]
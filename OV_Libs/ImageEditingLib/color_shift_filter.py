@@ -1,6 +1,6 @@
 from dataclasses import dataclass
 from colorsys import rgb_to_hsv, hsv_to_rgb
-from typing import Any, Iterable, List, Literal, Sequence, Tuple
+from typing import Any, Dict, Iterable, List, Literal, Optional, Sequence, Tuple
 
 from OV_Libs.pillow_compat import Image
 
@@ -118,19 +118,25 @@ class ColorShiftFilter:
         mask = Image.new("RGBA", (width, height), (0, 0, 0, 255))
         mask_pixels = mask.load()
         
+        # Selection and shift depend only on the color, so resolve each
+        # distinct color once (None = not selected) and reuse it per pixel
+        shifted_by_color: Dict[RgbaColor, Optional[RgbaColor]] = {}
+        
         # Process each pixel
         for y in range(height):
             for x in range(width):
                 original_pixel = source_pixels[x, y]
                 
-                # Check if this pixel's color is in the selection
-                if self._is_color_selected(
-                    original_pixel, base_color, options
-                ):
-                    # Apply the shift
-                    shifted_pixel = self.apply_shift(
-                        original_pixel, options, shift_value
-                    )
+                if original_pixel in shifted_by_color:
+                    shifted_pixel = shifted_by_color[original_pixel]
+                elif self._is_color_selected(original_pixel, base_color, options):
+                    shifted_pixel = self.apply_shift(original_pixel, options, shift_value)
+                    shifted_by_color[original_pixel] = shifted_pixel
+                else:
+                    shifted_pixel = None
+                    shifted_by_color[original_pixel] = None
+                
+                if shifted_pixel is not None:
                     modified_pixels[x, y] = shifted_pixel
                     # Mark as changed (white in mask)
                     mask_pixels[x, y] = (255, 255, 255, 255)
@@ -419,4 +425,7 @@ class ColorShiftFilter:
         return max(0.0, min(1.0, shifted))
 
     def _clamp_byte(self, value: float) -> int:
-        return int(max(0, min(255, round(value))))
\ No newline at end of file
+        if type(value) is int:
+            return 0 if value < 0 else 255 if value > 255 else value
+        rounded = round(value)
+        return 0 if rounded < 0 else 255 if rounded > 255 else rounded
\ No newline at end of file
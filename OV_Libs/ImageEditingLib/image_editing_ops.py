@@ -8,14 +8,42 @@ Functions:
     extract_unique_colors: Extract all unique colors from an image
     build_identity_mapping: Create a color-to-color identity mapping
     apply_color_mapping: Apply color replacements to an image
+    find_colors_within_distance: Find colors within an RGB distance of a base color
     save_images: Batch save multiple ImageRecords to disk
 """
 
+import operator
+import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, Dict, List, Sequence
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 
 from OV_Libs.ImageEditingLib.image_models import RgbaColor
 from OV_Libs.constants import OUTPUT_FILE_PREFIX, DEFAULT_OUTPUT_FORMAT
+from OV_Libs.pillow_compat import Image, ImageClass
+
+# NumPy is optional; without it the per-pixel Python paths are used
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Palette size up to which Pillow's C color counter is used before falling back to a full unique pass
+MAX_COUNTED_COLORS = 1 << 16
+
+
+def _can_vectorize(image: Any) -> bool:
+    return np is not None and getattr(image, "mode", None) == "RGBA"
+
+
+def _packed_rgba(rgba: Any) -> Any:
+    """
+    View an (..., 4) uint8 RGBA array as one big-endian uint32 per pixel.
+
+    Big-endian packing makes numeric order match (r, g, b, a) tuple order,
+    and the result is a view, so writes go straight back into ``rgba``.
+    """
+    return rgba.reshape(-1, 4).view(">u4").reshape(-1)
 
 
 def extract_unique_colors(image: Any) -> List[RgbaColor]:
@@ -28,6 +56,16 @@ def extract_unique_colors(image: Any) -> List[RgbaColor]:
     Returns:
         A sorted list of unique RGBA color tuples found in the image
     """
+    if getattr(image, "mode", None) == "RGBA":
+        # getcolors bails out early (returning None) once the palette exceeds the limit
+        counted_colors = image.getcolors(maxcolors=MAX_COUNTED_COLORS)
+        if counted_colors is not None:
+            return sorted(color for _count, color in counted_colors)
+
+    if _can_vectorize(image):
+        unique_packed = np.unique(_packed_rgba(np.asarray(image)))
+        return [tuple(color) for color in unique_packed.view(np.uint8).reshape(-1, 4).tolist()]
+
     unique_colors = set(image.getdata())
     return sorted(unique_colors)
 
@@ -59,7 +97,19 @@ def apply_color_mapping(image: Any, color_mappings: Dict[RgbaColor, RgbaColor])
     Returns:
         A new PIL Image with color replacements applied
     """
+    if _can_vectorize(image):
+        changed = _changed_rgba_entries(color_mappings)
+        if changed is not None:
+            return _apply_color_mapping_numpy(image, changed)
+
     img = image.copy()
+    if ImageClass is not None and isinstance(image, ImageClass):
+        # Reading and writing the whole pixel sequence in one call each is much cheaper
+        # than indexing the pixel access object twice per pixel
+        read_pixels = getattr(image, "get_flattened_data", None) or image.getdata
+        img.putdata([color_mappings.get(color, color) for color in read_pixels()])
+        return img
+
     pixels = img.load()
 
     for y in range(img.height):
@@ -72,6 +122,114 @@ def apply_color_mapping(image: Any, color_mappings: Dict[RgbaColor, RgbaColor])
     return img
 
 
+def _as_rgba_bytes(color: Any) -> Optional[RgbaColor]:
+    """Return ``color`` as four plain ints in 0-255, or None if it is not an RGBA byte tuple."""
+    if not isinstance(color, tuple) or len(color) != 4:
+        return None
+    try:
+        channels = tuple(operator.index(channel) for channel in color)
+    except TypeError:
+        return None
+    if not all(0 <= channel <= 255 for channel in channels):
+        return None
+    return channels
+
+
+def _as_rgba_source(color: Any) -> Optional[RgbaColor]:
+    """Return the RGBA byte tuple a pixel must equal to match ``color``, or None if none can."""
+    if not isinstance(color, tuple) or len(color) != 4:
+        return None
+    channels = []
+    for channel in color:
+        try:
+            value = int(channel)
+        except (TypeError, ValueError, OverflowError):
+            return None
+        if value != channel or not 0 <= value <= 255:
+            return None
+        channels.append(value)
+    return tuple(channels)
+
+
+def _changed_rgba_entries(color_mappings: Dict[RgbaColor, RgbaColor]) -> Optional[List[Tuple[RgbaColor, RgbaColor]]]:
+    """
+    Collect the mapping entries the NumPy lookup table can represent.
+
+    Sources are matched by equality, as the dict lookup on the Pillow path does, so NumPy
+    integers and integral floats count; sources no RGBA pixel can equal are dropped, as are
+    identity entries. Returns None when a matching source has a target the table cannot hold,
+    so the caller can leave that case to Pillow's own pixel handling.
+    """
+    changed = []
+    for source, target in color_mappings.items():
+        if source == target:
+            continue
+        source_bytes = _as_rgba_source(source)
+        if source_bytes is None:
+            continue
+        target_bytes = _as_rgba_bytes(target)
+        if target_bytes is None:
+            return None
+        changed.append((source_bytes, target_bytes))
+    return changed
+
+
+def _apply_color_mapping_numpy(image: Any, changed: List[Tuple[RgbaColor, RgbaColor]]) -> Any:
+    if not changed:
+        return image.copy()
+
+    rgba = np.array(image, dtype=np.uint8)
+    packed = _packed_rgba(rgba)
+
+    # Sorted source colors let every pixel find its mapping with one binary search
+    table = np.array(changed, dtype=np.uint8)
+    sources = _packed_rgba(table[:, 0])
+    targets = _packed_rgba(table[:, 1])
+    order = np.argsort(sources)
+    sources = sources[order]
+    targets = targets[order]
+
+    positions = np.searchsorted(sources, packed)
+    np.minimum(positions, len(sources) - 1, out=positions)
+    matched = sources[positions] == packed
+    packed[matched] = targets[positions[matched]]
+
+    result = Image.fromarray(rgba)
+    result.info = dict(image.info)
+    return result
+
+
+def find_colors_within_distance(
+    colors: Sequence[RgbaColor], base_color: RgbaColor, tolerance: float
+) -> List[int]:
+    """
+    Find the colors whose RGB distance to a base color is within a tolerance.
+
+    Distances are compared squared, so no square roots are taken. Alpha is ignored.
+
+    Args:
+        colors: A sequence of RGBA color tuples
+        base_color: The RGBA color to measure from
+        tolerance: Maximum Euclidean RGB distance to include
+
+    Returns:
+        Indices into ``colors`` of every color within the tolerance, in order
+    """
+    tolerance_squared = tolerance * tolerance
+    r0, g0, b0 = base_color[:3]
+
+    if np is not None and len(colors):
+        diff = np.asarray(colors, dtype=np.int32)[:, :3] - np.array((r0, g0, b0), dtype=np.int32)
+        distance_squared = np.einsum("ij,ij->i", diff, diff)
+        return np.flatnonzero(distance_squared <= tolerance_squared).tolist()
+
+    return [
+        index
+        for index, (r, g, b, _a) in enumerate(colors)
+        if (r - r0) * (r - r0) + (g - g0) * (g - g0) + (b - b0) * (b - b0) <= tolerance_squared
+    ]
+
+
 def save_images(records, output_dir: Path) -> int:
     """
     Save multiple ImageRecords to disk in PNG format.
@@ -94,9 +252,19 @@ def save_images(records, output_dir: Path) -> int:
     if not output_dir.is_dir():
         raise OSError(f"Output path is not a directory: {output_dir}")
     
-    saved_count = 0
-    for record in records:
-        save_path = output_dir / f"{OUTPUT_FILE_PREFIX}{record.path.name}"
-        record.modified.save(save_path, format=DEFAULT_OUTPUT_FORMAT)
-        saved_count += 1
-    return saved_count
+    records = list(records)
+    if not records:
+        return 0
+
+    # Records sharing a file name overwrite each other, so only the last one per path is written;
+    # that keeps two threads from ever writing the same file
+    records_by_path = {output_dir / f"{OUTPUT_FILE_PREFIX}{record.path.name}": record for record in records}
+
+    def save_record(save_path: Path) -> None:
+        records_by_path[save_path].modified.save(save_path, format=DEFAULT_OUTPUT_FORMAT)
+
+    # PNG encoding releases the GIL, so the files are written in parallel
+    with ThreadPoolExecutor(max_workers=min(len(records_by_path), os.cpu_count() or 1)) as executor:
+        for _ in executor.map(save_record, records_by_path):
+            pass
+    return len(records)
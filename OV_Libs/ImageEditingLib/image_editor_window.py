@@ -1,15 +1,29 @@
-import math
+import os
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, Dict, List, Optional
-
-from PyQt5.QtCore import Qt
-from PyQt5.QtGui import QPixmap
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from PyQt5.QtCore import (
+    QItemSelection,
+    QItemSelectionModel,
+    QObject,
+    QRunnable,
+    QSize,
+    QStringListModel,
+    Qt,
+    QThreadPool,
+    QTimer,
+    pyqtSignal,
+)
+from PyQt5.QtGui import QImage, QPixmap
 from PyQt5.QtWidgets import (
     QAbstractItemView,
     QFileDialog,
     QColorDialog,
     QHBoxLayout,
     QLabel,
+    QListView,
     QListWidget,
     QMainWindow,
     QMessageBox,
@@ -18,10 +32,46 @@ from PyQt5.QtWidgets import (
     QWidget,
 )
 
-from OV_Libs.ImageEditingLib.image_editing_ops import apply_color_mapping, build_identity_mapping, extract_unique_colors, save_images
+from OV_Libs.ImageEditingLib.image_editing_ops import (
+    apply_color_mapping,
+    extract_unique_colors,
+    find_colors_within_distance,
+    save_images,
+)
 from OV_Libs.ImageEditingLib.image_models import ImageRecord, RgbaColor
 from OV_Libs.pillow_compat import Image
 
+# Decoded images kept per (path, mtime, size) so re-adding an unchanged file skips the decode
+DECODED_IMAGE_CACHE_SIZE = 16
+
+
+def _decode_rgba(image_path: Path) -> Any:
+    with Image.open(image_path) as image:
+        return image.convert("RGBA")
+
+
+class _ImageTaskSignals(QObject):
+    finished = pyqtSignal(int, int, object)
+    failed = pyqtSignal(int, str)
+
+
+class _ImageTaskRunnable(QRunnable):
+    def __init__(self, request_id: int, image_index: int, func: Callable[..., Any], *args: Any) -> None:
+        super().__init__()
+        self.request_id = request_id
+        self.image_index = image_index
+        self.func = func
+        self.args = args
+        self.signals = _ImageTaskSignals()
+
+    def run(self) -> None:
+        try:
+            result = self.func(*self.args)
+        except Exception as exc:
+            self.signals.failed.emit(self.request_id, str(exc))
+            return
+        self.signals.finished.emit(self.request_id, self.image_index, result)
+
 
 class OpenVisionEditorWindow(QMainWindow):
     def __init__(self, project_path: Optional[Path] = None) -> None:
@@ -36,6 +86,18 @@ class OpenVisionEditorWindow(QMainWindow):
         self.unique_colors: List[RgbaColor] = []
         self.color_mappings: Dict[RgbaColor, RgbaColor] = {}
         self.base_color: Optional[RgbaColor] = None
+        self._apply_request_id = 0
+        self._image_apply_requests: Dict[int, int] = {}
+        self._extract_request_id = 0
+        self._apply_all_request_id: Optional[int] = None
+        self._apply_all_pending = 0
+        self._preview_cache: Dict[QLabel, Tuple[Any, QSize, QPixmap]] = {}
+        self._decoded_images: "OrderedDict[Tuple[str, int, int], Any]" = OrderedDict()
+
+        self._preview_refresh_timer = QTimer(self)
+        self._preview_refresh_timer.setSingleShot(True)
+        self._preview_refresh_timer.setInterval(0)
+        self._preview_refresh_timer.timeout.connect(self.refresh_previews)
 
         self._build_ui()
         self._connect_signals()
@@ -58,9 +120,17 @@ class OpenVisionEditorWindow(QMainWindow):
         self.btn_select_range = QPushButton("Select Colors in Range")
 
         self.images_list = QListWidget()
-        self.original_colors_list = QListWidget()
+
+        self.original_colors_model = QStringListModel(self)
+        self.original_colors_list = QListView()
+        self.original_colors_list.setModel(self.original_colors_model)
         self.original_colors_list.setSelectionMode(QAbstractItemView.MultiSelection)
-        self.replacement_colors_list = QListWidget()
+        self.replacement_colors_model = QStringListModel(self)
+        self.replacement_colors_list = QListView()
+        self.replacement_colors_list.setModel(self.replacement_colors_model)
+        for colors_list in (self.original_colors_list, self.replacement_colors_list):
+            colors_list.setUniformItemSizes(True)
+            colors_list.setEditTriggers(QAbstractItemView.NoEditTriggers)
 
         self.label_base_color = QLabel("Base: not selected")
         self.label_original_preview = QLabel("Original Preview")
@@ -97,7 +167,7 @@ class OpenVisionEditorWindow(QMainWindow):
     def _connect_signals(self) -> None:
         self.btn_load_images.clicked.connect(self.load_images)
         self.images_list.currentRowChanged.connect(self.on_image_selected)
-        self.replacement_colors_list.itemDoubleClicked.connect(self.change_replacement_color)
+        self.replacement_colors_list.doubleClicked.connect(self.change_replacement_color)
         self.btn_pick_base.clicked.connect(self.pick_base_color)
         self.btn_select_range.clicked.connect(self.select_by_range)
         self.btn_apply_current.clicked.connect(self.apply_to_current)
@@ -115,15 +185,34 @@ class OpenVisionEditorWindow(QMainWindow):
         if not file_paths:
             return
 
-        for path_str in file_paths:
-            image_path = Path(path_str)
-            original = Image.open(image_path).convert("RGBA")
-            self.images.append(ImageRecord(path=image_path, original=original, modified=original.copy()))
+        image_paths = [Path(path_str) for path_str in file_paths]
+        for image_path, original in zip(image_paths, self._open_rgba_images(image_paths)):
+            self.images.append(ImageRecord(path=image_path, original=original, modified=original))
             self.images_list.addItem(image_path.name)
 
         if self.current_image_index is None and self.images:
             self.images_list.setCurrentRow(0)
 
+    def _open_rgba_images(self, image_paths: List[Path]) -> List[Any]:
+        keys = []
+        for image_path in image_paths:
+            stat = image_path.stat()
+            keys.append((str(image_path.resolve()), stat.st_mtime_ns, stat.st_size))
+
+        missing = {key: image_path for key, image_path in zip(keys, image_paths) if key not in self._decoded_images}
+        if missing:
+            with ThreadPoolExecutor(max_workers=min(len(missing), os.cpu_count() or 1)) as executor:
+                for key, image in zip(missing, executor.map(_decode_rgba, missing.values())):
+                    self._decoded_images[key] = image
+
+        images = []
+        for key in keys:
+            self._decoded_images.move_to_end(key)
+            images.append(self._decoded_images[key])
+        while len(self._decoded_images) > DECODED_IMAGE_CACHE_SIZE:
+            self._decoded_images.popitem(last=False)
+        return images
+
     def on_image_selected(self, index: int) -> None:
         if index < 0 or index >= len(self.images):
             self.current_image_index = None
@@ -132,27 +221,52 @@ class OpenVisionEditorWindow(QMainWindow):
         self.current_image_index = index
         self.extract_unique_colors()
         self.populate_color_lists()
-        self.refresh_previews()
+        self._schedule_preview_refresh()
 
     def extract_unique_colors(self) -> None:
         if self.current_image_index is None:
             return
 
+        self._extract_request_id += 1
         current = self.images[self.current_image_index]
-        self.unique_colors = extract_unique_colors(current.original)
-        self.color_mappings = build_identity_mapping(self.unique_colors)
+        self.color_mappings = {}
+        if current.unique_colors is not None:
+            self.unique_colors = current.unique_colors
+            return
 
-    def populate_color_lists(self) -> None:
-        self.original_colors_list.clear()
-        self.replacement_colors_list.clear()
+        self.unique_colors = []
+        runnable = _ImageTaskRunnable(
+            self._extract_request_id, self.current_image_index, extract_unique_colors, current.original
+        )
+        runnable.signals.finished.connect(self._on_colors_extracted, Qt.QueuedConnection)
+        runnable.signals.failed.connect(self._on_color_extract_failed, Qt.QueuedConnection)
+        QThreadPool.globalInstance().start(runnable)
 
-        for original_color in self.unique_colors:
-            self.original_colors_list.addItem(f"RGBA: {original_color}")
-            mapped_color = self.color_mappings.get(original_color, original_color)
-            self.replacement_colors_list.addItem(f"RGBA: {mapped_color}")
+    def _on_colors_extracted(self, request_id: int, image_index: int, colors: List[RgbaColor]) -> None:
+        if image_index >= len(self.images):
+            return
+
+        self.images[image_index].unique_colors = colors
+        if request_id != self._extract_request_id or image_index != self.current_image_index:
+            return
+
+        self.unique_colors = colors
+        self.populate_color_lists()
+
+    def _on_color_extract_failed(self, request_id: int, message: str) -> None:
+        if request_id != self._extract_request_id:
+            return
+
+        QMessageBox.warning(self, "Color Extraction Failed", message)
+
+    def populate_color_lists(self) -> None:
+        self.original_colors_model.setStringList([f"RGBA: {color}" for color in self.unique_colors])
+        self.replacement_colors_model.setStringList(
+            [f"RGBA: {self.color_mappings.get(color, color)}" for color in self.unique_colors]
+        )
 
     def change_replacement_color(self) -> None:
-        selected_row = self.replacement_colors_list.currentRow()
+        selected_row = self.replacement_colors_list.currentIndex().row()
         if selected_row < 0:
             return
 
@@ -163,7 +277,7 @@ class OpenVisionEditorWindow(QMainWindow):
         new_color = (color.red(), color.green(), color.blue(), 255)
         original_color = self.unique_colors[selected_row]
         self.color_mappings[original_color] = new_color
-        self.replacement_colors_list.item(selected_row).setText(f"RGBA: {new_color}")
+        self.replacement_colors_model.setData(self.replacement_colors_model.index(selected_row), f"RGBA: {new_color}")
 
     def pick_base_color(self) -> None:
         color = QColorDialog.getColor(parent=self, title="Pick base color")
@@ -179,21 +293,12 @@ class OpenVisionEditorWindow(QMainWindow):
             return
 
         tolerance = 30
-        r0, g0, b0, _ = self.base_color
-
-        selected_colors = []
-        for color in self.unique_colors:
-            r, g, b, _ = color
-            distance = math.sqrt((r - r0) ** 2 + (g - g0) ** 2 + (b - b0) ** 2)
-            if distance <= tolerance:
-                selected_colors.append(color)
-
-        self.original_colors_list.clearSelection()
-        for index, color in enumerate(self.unique_colors):
-            if color in selected_colors:
-                item = self.original_colors_list.item(index)
-                if item is not None:
-                    item.setSelected(True)
+        selection = QItemSelection()
+        for index in find_colors_within_distance(self.unique_colors, self.base_color, tolerance):
+            model_index = self.original_colors_model.index(index)
+            selection.select(model_index, model_index)
+
+        self.original_colors_list.selectionModel().select(selection, QItemSelectionModel.ClearAndSelect)
 
     def apply_hsv_to_selected(self) -> None:
         raise NotImplementedError("Implement HSV mass-edit for selected colors")
@@ -205,19 +310,59 @@ class OpenVisionEditorWindow(QMainWindow):
         if self.current_image_index is None:
             return
 
+        self._apply_request_id += 1
         current = self.images[self.current_image_index]
-        current.modified = apply_color_mapping(current.original, self.color_mappings)
-        self.refresh_previews()
+        self._start_color_mapping(self.current_image_index, current.original, dict(self.color_mappings))
+
+    def _start_color_mapping(
+        self,
+        image_index: int,
+        image: Any,
+        color_mappings: Dict[RgbaColor, RgbaColor],
+    ) -> None:
+        self._image_apply_requests[image_index] = self._apply_request_id
+        runnable = _ImageTaskRunnable(
+            self._apply_request_id, image_index, apply_color_mapping, image, color_mappings
+        )
+        runnable.signals.finished.connect(self._on_color_mapping_finished, Qt.QueuedConnection)
+        runnable.signals.failed.connect(self._on_color_mapping_failed, Qt.QueuedConnection)
+        QThreadPool.globalInstance().start(runnable)
+
+    def _on_color_mapping_finished(self, request_id: int, image_index: int, result: Any) -> None:
+        if self._image_apply_requests.get(image_index) == request_id and image_index < len(self.images):
+            del self._image_apply_requests[image_index]
+            self.images[image_index].modified = result
+            if image_index == self.current_image_index:
+                self._schedule_preview_refresh()
+
+        if request_id == self._apply_all_request_id:
+            self._apply_all_pending -= 1
+            if not self._apply_all_pending:
+                self._apply_all_request_id = None
+                self._show_info("Success", "Color mappings applied to all loaded images.")
+
+    def _on_color_mapping_failed(self, request_id: int, message: str) -> None:
+        if request_id not in self._image_apply_requests.values():
+            return
+
+        self._image_apply_requests = {
+            index: latest for index, latest in self._image_apply_requests.items() if latest != request_id
+        }
+        if request_id == self._apply_all_request_id:
+            self._apply_all_request_id = None
+            self._apply_all_pending = 0
+        QMessageBox.warning(self, "Apply Failed", message)
 
     def apply_to_all(self) -> None:
         if not self.images:
             return
 
-        for record in self.images:
-            record.modified = apply_color_mapping(record.original, self.color_mappings)
-
-        self.refresh_previews()
-        self._show_info("Success", "Color mappings applied to all loaded images.")
+        self._apply_request_id += 1
+        self._apply_all_request_id = self._apply_request_id
+        self._apply_all_pending = len(self.images)
+        color_mappings = dict(self.color_mappings)
+        for image_index, record in enumerate(self.images):
+            self._start_color_mapping(image_index, record.original, color_mappings)
 
     def save_current(self) -> None:
         if self.current_image_index is None:
@@ -246,6 +391,10 @@ class OpenVisionEditorWindow(QMainWindow):
         saved_count = save_images(self.images, Path(folder))
         self._show_info("Success", f"All {saved_count} images saved to {folder}")
 
+    def _schedule_preview_refresh(self) -> None:
+        if not self._preview_refresh_timer.isActive():
+            self._preview_refresh_timer.start()
+
     def refresh_previews(self) -> None:
         if self.current_image_index is None:
             self.label_original_preview.setText("Original Preview")
@@ -257,25 +406,33 @@ class OpenVisionEditorWindow(QMainWindow):
         self._set_preview(self.label_modified_preview, current.modified)
 
     def _set_preview(self, label: QLabel, image: Any) -> None:
-        image_rgb = image.convert("RGB")
-        pixmap = QPixmap()
-        if not pixmap.loadFromData(self._to_png_bytes(image_rgb), "PNG"):
+        label_size = label.size()
+        cached = self._preview_cache.get(label)
+        if cached is not None and cached[0] is image and cached[1] == label_size:
+            label.setPixmap(cached[2])
+            return
+
+        pixmap = self._to_pixmap(image, label_size)
+        if pixmap.isNull():
             label.setText("Preview failed")
             return
 
         scaled = pixmap.scaled(
-            label.size(),
+            label_size,
             Qt.AspectRatioMode.KeepAspectRatio,
             Qt.TransformationMode.SmoothTransformation,
         )
+        self._preview_cache[label] = (image, label_size, scaled)
         label.setPixmap(scaled)
 
-    def _to_png_bytes(self, image: Any) -> bytes:
-        from io import BytesIO
-
-        buffer = BytesIO()
-        image.save(buffer, format="PNG")
-        return buffer.getvalue()
+    def _to_pixmap(self, image: Any, max_size: QSize) -> QPixmap:
+        image_rgb = image.convert("RGB")
+        if max_size.width() > 0 and max_size.height() > 0:
+            image_rgb.thumbnail((max_size.width(), max_size.height()), Image.Resampling.LANCZOS)
+        width, height = image_rgb.size
+        data = image_rgb.tobytes("raw", "RGB")
+        qimage = QImage(data, width, height, width * 3, QImage.Format_RGB888)
+        return QPixmap.fromImage(qimage)
 
     def _show_info(self, title: str, message: str) -> None:
         QMessageBox.information(self, title, message)
@@ -10,9 +10,9 @@ Type Aliases:
     RgbaColor: A tuple of 4 integers representing RGBA color values (0-255)
 """
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Tuple
+from typing import List, Optional, Tuple
 
 from OV_Libs.pillow_compat import Image
 
@@ -22,5 +22,8 @@ RgbaColor = Tuple[int, int, int, int]
 @dataclass
 class ImageRecord:
     path: Path
+    # Never mutated (mapping works on a copy), so ``modified`` and other records may share it
     original: 'Image.Image'
     modified: 'Image.Image'
+    # Sorted unique colors of ``original``, filled on first use
+    unique_colors: Optional[List[RgbaColor]] = field(default=None, repr=False, compare=False)
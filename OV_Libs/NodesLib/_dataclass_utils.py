@@ -0,0 +1,15 @@
+"""
+Dataclass helpers shared by the node configuration classes.
+"""
+
+from dataclasses import fields
+from typing import Any, Dict
+
+
+def shallow_asdict(obj: Any) -> Dict[str, Any]:
+    """
+    Convert a dataclass instance to a field-to-value dictionary.
+
+    Unlike dataclasses.asdict, field values are not recursively deep-copied.
+    """
+    return {field_info.name: getattr(obj, field_info.name) for field_info in fields(obj)}
@@ -12,11 +12,12 @@ Functions:
     execute_color_shift_node: Pipeline executor for color shift nodes
 """
 
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 
 from OV_Libs.pillow_compat import Image
+from OV_Libs.NodesLib._dataclass_utils import shallow_asdict
 from OV_Libs.ImageEditingLib.color_shift_filter import (
     ColorShiftFilter,
     ColorShiftFilterOptions,
@@ -57,7 +58,7 @@ class ColorShiftNodeConfig:
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary."""
-        return asdict(self)
+        return shallow_asdict(self)
     
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "ColorShiftNodeConfig":
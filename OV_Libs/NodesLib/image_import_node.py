@@ -41,7 +41,7 @@ def get_supported_image_formats() -> List[str]:
     Returns:
         List of file extensions (e.g., ['.png', '.jpg', ...])
     """
-    return sorted(list(STANDARD_IMAGE_FORMATS))
+    return sorted(STANDARD_IMAGE_FORMATS)
 
 
 def get_supported_movie_formats() -> List[str]:
@@ -51,7 +51,7 @@ def get_supported_movie_formats() -> List[str]:
     Returns:
         List of file extensions (e.g., ['.mp4', '.avi', ...])
     """
-    return sorted(list(MOVIE_FORMATS))
+    return sorted(MOVIE_FORMATS)
 
 
 def get_supported_gif_formats() -> List[str]:
@@ -61,7 +61,7 @@ def get_supported_gif_formats() -> List[str]:
     Returns:
         List containing ['.gif']
     """
-    return sorted(list(GIF_FORMAT))
+    return sorted(GIF_FORMAT)
 
 
 def get_supported_formats(include_movies: bool = False, include_gifs: bool = True) -> List[str]:
@@ -83,7 +83,7 @@ def get_supported_formats(include_movies: bool = False, include_gifs: bool = Tru
     if include_movies:
         formats.update(MOVIE_FORMATS)
     
-    return sorted(list(formats))
+    return sorted(formats)
 
 
 def is_supported_format(file_path: Path, include_movies: bool = False, include_gifs: bool = True) -> bool:
@@ -24,11 +24,14 @@ Example:
     >>> result = execute_image_layer_node(layer_config, [base])
 """
 
-from dataclasses import dataclass, asdict, field
+from dataclasses import dataclass, field
 from typing import Any, Dict, List, Optional
 
 from PIL import Image, ImageChops
 
+from OV_Libs.NodesLib._dataclass_utils import shallow_asdict
+from OV_Libs.NodesLib.image_import_node import execute_import_image_node
+
 
 @dataclass
 class LayerInfo:
@@ -61,7 +64,8 @@ class LayerInfo:
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary (excludes image objects)."""
-        data = asdict(self)
+        # asdict() would deep-copy the image and mask only for them to be discarded here
+        data = shallow_asdict(self)
         # Remove actual image objects, keep paths
         data["image"] = None
         data["mask"] = None
@@ -174,7 +178,6 @@ class ImageLayerCompositor:
         if layer.image is not None:
             overlay = layer.image
         elif layer.image_path is not None:
-            from OV_Libs.NodesLib.image_import_node import execute_import_image_node
             # Create minimal node config for importing
             import_node = {
                 "id": f"layer-{layer_idx}-import",
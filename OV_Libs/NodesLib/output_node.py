@@ -20,7 +20,7 @@ Functions:
     create_output_node: Helper to create output node dictionary
 """
 
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
@@ -28,6 +28,7 @@ import re
 import os
 
 from OV_Libs.pillow_compat import Image
+from OV_Libs.NodesLib._dataclass_utils import shallow_asdict
 
 
 @dataclass
@@ -57,7 +58,7 @@ class OutputNodeConfig:
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary."""
-        return asdict(self)
+        return shallow_asdict(self)
     
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "OutputNodeConfig":
@@ -177,7 +177,7 @@ class NodeExecutorRegistry:
         Returns:
             Sorted list of node type names
         """
-        return sorted(list(self._executors.keys()))
+        return sorted(self._executors)
     
     def get_metadata(self, node_type: str) -> Dict[str, Any]:
         """
@@ -222,11 +222,11 @@ class NodeExecutorRegistry:
             Sorted list of node type names with the tag
         """
         tag = str(tag).strip().lower()
-        return sorted([
+        return sorted(
             node_type
             for node_type, meta in self._node_metadata.items()
-            if tag in [t.lower() for t in meta.get("tags", [])]
-        ])
+            if any(t.lower() == tag for t in meta.get("tags", ()))
+        )
     
     def get_nodes_by_category(self, category: str) -> Dict[str, Any]:
         """
@@ -5,7 +5,10 @@ This module provides a builder class that creates node dictionaries and
 connection dictionaries compatible with Open Vision's pipeline system.
 """
 
+import pickle
+import sys
 from copy import deepcopy
+from functools import lru_cache
 from typing import Any, Dict, List, Optional, Tuple
 
 from OV_Libs.constants import (
@@ -22,6 +25,42 @@ from OV_Libs.constants import (
 )
 from OV_Libs.ProjStoreLib.pipeline_builder import build_pipeline_from_graph
 
+_SCALAR_TYPES = (str, int, float, bool, type(None))
+
+
+@lru_cache(maxsize=None)
+def _port_names(kind: str, total: int) -> Tuple[str, ...]:
+    """Return the interned port names for a node with ``total`` slots of ``kind``."""
+    if total == 1:
+        return (sys.intern(kind),)
+    return tuple(sys.intern(f"{kind}_{index}") for index in range(total))
+
+
+def _clone(value: Any) -> Any:
+    """Copy an arbitrary value with a pickle round trip, or ``deepcopy`` if it cannot be pickled."""
+    try:
+        return pickle.loads(pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL))
+    except (pickle.PicklingError, TypeError, AttributeError):
+        return deepcopy(value)
+
+
+def _fast_clone(value: Any) -> Any:
+    """Clone JSON-shaped containers without deepcopy's memo bookkeeping.
+
+    Only exact dict/list/tuple types are walked; anything else that is not a
+    scalar falls back to ``_clone``.
+    """
+    value_type = type(value)
+    if value_type is dict:
+        return {key: _fast_clone(item) for key, item in value.items()}
+    if value_type is list:
+        return [_fast_clone(item) for item in value]
+    if value_type is tuple:
+        return tuple(_fast_clone(item) for item in value)
+    if isinstance(value, _SCALAR_TYPES):
+        return value
+    return _clone(value)
+
 
 class NodeGraphBuilder:
     """Build node graphs with explicit input/output slot counts.
@@ -35,6 +74,9 @@ class NodeGraphBuilder:
         - Generated graph data is compatible with ``build_pipeline_from_graph``.
     """
 
+    # Builder-validated fields that always hold immutable scalars
+    NODE_CORE_FIELDS = frozenset({FIELD_NODE_ID, FIELD_NODE_TYPE, FIELD_NODE_X, FIELD_NODE_Y})
+
     def __init__(
         self,
         start_x: float = 100.0,
@@ -52,11 +94,18 @@ class NodeGraphBuilder:
         self._input_links: Dict[Tuple[str, int], str] = {}
         self._output_links: Dict[Tuple[str, int], List[str]] = {}
 
-    @staticmethod
-    def _port_name(kind: str, index: int, total: int) -> str:
-        if total == 1:
-            return kind
-        return f"{kind}_{index}"
+    @classmethod
+    def _copy_node(cls, node: Dict[str, Any]) -> Dict[str, Any]:
+        """Copy a node dict, sharing immutable values and deep-copying only nested containers."""
+        copied: Dict[str, Any] = {}
+        for key, value in node.items():
+            if key in cls.NODE_CORE_FIELDS or isinstance(value, _SCALAR_TYPES):
+                copied[key] = value
+            elif key == "linked_outputs":
+                copied[key] = [list(targets) for targets in value]
+            else:
+                copied[key] = _fast_clone(value)
+        return copied
 
     @staticmethod
     def _validate_slot_count(name: str, count: int) -> None:
@@ -104,18 +153,12 @@ class NodeGraphBuilder:
         node_x = float(x) if x is not None else self.start_x + (node_index * self.x_spacing)
         node_y = float(y) if y is not None else self.start_y
 
-        input_ports = [
-            self._port_name("input", index, input_count)
-            for index in range(input_count)
-        ]
-        output_ports = [
-            self._port_name("output", index, output_count)
-            for index in range(output_count)
-        ]
+        input_ports = list(_port_names("input", input_count))
+        output_ports = list(_port_names("output", output_count))
 
         node: Dict[str, Any] = {
-            FIELD_NODE_ID: normalized_id,
-            FIELD_NODE_TYPE: normalized_type,
+            FIELD_NODE_ID: sys.intern(normalized_id),
+            FIELD_NODE_TYPE: sys.intern(normalized_type),
             FIELD_NODE_X: node_x,
             FIELD_NODE_Y: node_y,
             "input_ports": input_ports,
@@ -128,7 +171,7 @@ class NodeGraphBuilder:
         self._nodes_by_id[normalized_id] = node
         self._node_order.append(normalized_id)
 
-        return deepcopy(node)
+        return self._copy_node(node)
 
     def connect(
         self,
@@ -200,7 +243,7 @@ class NodeGraphBuilder:
         if target_id not in target_outputs:
             target_outputs.append(target_id)
 
-        return deepcopy(connection)
+        return dict(connection)
 
     def connect_chain(
         self,
@@ -250,11 +293,11 @@ class NodeGraphBuilder:
 
     def get_nodes(self) -> List[Dict[str, Any]]:
         """Return node list in insertion order."""
-        return [deepcopy(self._nodes_by_id[node_id]) for node_id in self._node_order]
+        return [self._copy_node(self._nodes_by_id[node_id]) for node_id in self._node_order]
 
     def get_connections(self) -> List[Dict[str, str]]:
         """Return all connections in creation order."""
-        return deepcopy(self._connections)
+        return [dict(connection) for connection in self._connections]
 
     def to_graph(self) -> Dict[str, Any]:
         """Return ``{"nodes": [...], "connections": [...]}`` graph payload."""
@@ -8,6 +8,7 @@ to a pipeline stage that is one more than the highest stage of its input nodes.
 Inspired by the Teensy Audio Library's approach to node-based processing.
 """
 
+from collections import deque
 from typing import Dict, List, Set, Tuple, Any, Iterable, Optional
 
 
@@ -426,7 +427,7 @@ def build_update_pipeline(
 
         all_node_ids = {str(node.get("id", "")) for node in nodes if node.get("id")}
         normalized_updated = _normalize_updated_nodes(updated_node_ids)
-        valid_updated = {nid for nid in normalized_updated if nid in all_node_ids}
+        valid_updated = normalized_updated & all_node_ids
 
         if not valid_updated:
             return {"stages": [], "max_stage": -1, "execution_order": []}, False, [
@@ -437,9 +438,9 @@ def build_update_pipeline(
 
         # Collect all downstream nodes reachable from updated nodes
         affected: Set[str] = set(valid_updated)
-        queue = list(valid_updated)
+        queue = deque(valid_updated)
         while queue:
-            current = queue.pop(0)
+            current = queue.popleft()
             for next_node in downstream_map.get(current, []):
                 if next_node not in affected:
                     affected.add(next_node)
@@ -22,6 +22,8 @@ Functions:
 """
 
 import json
+import os
+import re
 import uuid
 from datetime import datetime
 from pathlib import Path
@@ -64,6 +66,36 @@ from OV_Libs.constants import (
     FIELD_TO_PORT,
 )
 
+try:
+    # orjson parses straight from bytes and encodes several times faster than the stdlib module
+    import orjson
+
+    _json_loads = orjson.loads
+
+    def _json_dumps(payload: Dict[str, Any]) -> bytes:
+        return orjson.dumps(payload, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+
+except ImportError:
+    _json_loads = json.loads
+
+    def _json_dumps(payload: Dict[str, Any]) -> bytes:
+        return json.dumps(payload, indent=2).encode("utf-8")
+
+
+# create_project_file writes the name as the first top-level key after the schema version,
+# so it can usually be read without parsing the (potentially large) node graph. Files laid
+# out differently, or names with escape sequences, go through the full JSON parse.
+PROJECT_NAME_SCAN_BYTES = 4096
+_PROJECT_NAME_PATTERN = re.compile(
+    rb'\s*\{\s*(?:"schema_version"\s*:\s*\d+\s*,\s*)?"name"\s*:\s*"([^"\\]*)"\s*[,}]'
+)
+# Bytes read from the end of the file to check that it was not truncated
+PROJECT_TAIL_SCAN_BYTES = 64
+
+# Anything other than letters, digits and the safe characters is replaced in file names.
+# \w also admits "_", which is the replacement character anyway.
+_UNSAFE_FILENAME_PATTERN = re.compile(f"[^\\w{re.escape(SAFE_FILENAME_CHARS)}]")
+
 
 def _create_node_dict(node_id: str, node_type: str, x: float, y: float) -> Dict[str, Any]:
     """Helper to create a node dictionary with standard fields."""
@@ -139,7 +171,13 @@ def get_projects_dir(base_dir: Path) -> Path:
 
 def list_project_files(base_dir: Path) -> List[Path]:
     projects_dir = get_projects_dir(base_dir)
-    return sorted(projects_dir.glob(f"*{PROJECT_EXTENSION}"))
+    with os.scandir(projects_dir) as entries:
+        paths = [
+            Path(entry.path)
+            for entry in entries
+            if entry.name.endswith(PROJECT_EXTENSION) and entry.is_file()
+        ]
+    return sorted(paths)
 
 
 def create_project_file(base_dir: Path, project_name: str) -> Path:
@@ -159,10 +197,7 @@ def create_project_file(base_dir: Path, project_name: str) -> Path:
     projects_dir = get_projects_dir(base_dir)
     
     # Sanitize filename - keep only alphanumeric and safe characters
-    safe_name = "".join(
-        c if c.isalnum() or c in SAFE_FILENAME_CHARS else FILENAME_REPLACEMENT_CHAR
-        for c in project_name
-    ).strip(FILENAME_REPLACEMENT_CHAR)
+    safe_name = _UNSAFE_FILENAME_PATTERN.sub(FILENAME_REPLACEMENT_CHAR, project_name).strip(FILENAME_REPLACEMENT_CHAR)
     
     if not safe_name:
         safe_name = "new_project"
@@ -183,7 +218,7 @@ def create_project_file(base_dir: Path, project_name: str) -> Path:
         FIELD_OUTPUT_PRESETS: {},
     }
 
-    project_path.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+    project_path.write_bytes(_json_dumps(payload))
     return project_path
 
 
@@ -198,7 +233,18 @@ def load_project_name(project_path: Path) -> str:
         The project name, or the filename stem if loading fails
     """
     try:
-        payload = json.loads(project_path.read_text(encoding="utf-8"))
+        with project_path.open("rb") as handle:
+            head = handle.read(PROJECT_NAME_SCAN_BYTES)
+            match = _PROJECT_NAME_PATTERN.match(head)
+            if match:
+                handle.seek(max(handle.seek(0, os.SEEK_END) - PROJECT_TAIL_SCAN_BYTES, 0))
+                if handle.read().rstrip().endswith(b"}"):
+                    try:
+                        return match.group(1).decode("utf-8") or project_path.stem
+                    except UnicodeDecodeError:
+                        pass
+            handle.seek(0)
+            payload = _json_loads(handle.read())
     except (FileNotFoundError, json.JSONDecodeError, OSError):
         return project_path.stem
 
@@ -207,7 +253,7 @@ def load_project_name(project_path: Path) -> str:
 
 def load_project_data(project_path: Path) -> Dict[str, Any]:
     try:
-        payload = json.loads(project_path.read_text(encoding="utf-8"))
+        payload = _json_loads(project_path.read_bytes())
     except Exception:
         payload = {}
 
@@ -286,7 +332,7 @@ def load_project_data(project_path: Path) -> Dict[str, Any]:
 
 def save_project_data(project_path: Path, payload: Dict[str, Any]) -> None:
     payload["schema_version"] = SCHEMA_VERSION
-    project_path.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+    project_path.write_bytes(_json_dumps(payload))
 
 
 def load_project_nodes(project_path: Path) -> List[Dict[str, Any]]:
@@ -1,11 +1,13 @@
+import sys
 import uuid
 from pathlib import Path
-from typing import Callable, Dict, List, Optional
+from typing import Callable, Dict, List, NamedTuple, Optional, Set, Tuple
 
-from PyQt5.QtCore import QLineF, QRectF, Qt
+from PyQt5.QtCore import QLineF, QPointF, QRectF, Qt, QTimer
 from PyQt5.QtGui import QBrush, QColor, QPen
 from PyQt5.QtWidgets import (
     QGraphicsEllipseItem,
+    QGraphicsItem,
     QGraphicsLineItem,
     QGraphicsRectItem,
     QGraphicsScene,
@@ -20,8 +22,25 @@ from PyQt5.QtWidgets import (
     QWidget,
 )
 
+from OV_Libs.constants import DEFAULT_NODE_HEIGHT, DEFAULT_NODE_WIDTH, DEFAULT_PORT_OFFSET, DEFAULT_PORT_SIZE
 from OV_Libs.ProjStoreLib.project_store import load_project_graph, save_project_graph
 
+_POSITION_HAS_CHANGED = QGraphicsItem.ItemPositionHasChanged
+
+# Minimum time between connection line refreshes while nodes are dragged (~60 Hz)
+CONNECTION_UPDATE_INTERVAL_MS = 16
+# Fixed BSP depth (Qt's automatic minimum) so adding nodes never regenerates the tree
+SCENE_BSP_TREE_DEPTH = 5
+# Space kept around the outermost node when the scene rect grows to fit it
+SCENE_MARGIN = 500.0
+
+
+class Connection(NamedTuple):
+    from_node: str
+    from_port: str
+    to_node: str
+    to_port: str
+
 
 class PortItem(QGraphicsEllipseItem):
     def __init__(
@@ -40,6 +59,7 @@ class PortItem(QGraphicsEllipseItem):
         self.port_kind = port_kind
         self.on_port_clicked = on_port_clicked
         self.setAcceptedMouseButtons(Qt.LeftButton)
+        self.setCacheMode(QGraphicsItem.DeviceCoordinateCache)
 
     def mousePressEvent(self, event) -> None:
         if self.on_port_clicked is not None:
@@ -48,54 +68,96 @@ class PortItem(QGraphicsEllipseItem):
 
 
 class NodeItem(QGraphicsRectItem):
+    PORT_Y = (DEFAULT_NODE_HEIGHT - DEFAULT_PORT_SIZE) / 2
+    INPUT_PORT_RECT = QRectF(-DEFAULT_PORT_OFFSET, PORT_Y, DEFAULT_PORT_SIZE, DEFAULT_PORT_SIZE)
+    OUTPUT_PORT_RECT = QRectF(DEFAULT_NODE_WIDTH - DEFAULT_PORT_OFFSET, PORT_Y, DEFAULT_PORT_SIZE, DEFAULT_PORT_SIZE)
+    INPUT_ANCHOR = QPointF(0, DEFAULT_NODE_HEIGHT / 2)
+    OUTPUT_ANCHOR = QPointF(DEFAULT_NODE_WIDTH, DEFAULT_NODE_HEIGHT / 2)
+    BRUSH = QBrush(QColor("#2d2d30"))
+    PEN = QPen(QColor("#8a8a8a"), 1.5)
+    LABEL_BRUSH = QBrush(QColor("#f0f0f0"))
+    INPUT_PORT_BRUSH = QBrush(QColor("#9cdcfe"))
+    INPUT_PORT_PEN = QPen(QColor("#d0ebff"), 1.0)
+    OUTPUT_PORT_BRUSH = QBrush(QColor("#6aeb8f"))
+    OUTPUT_PORT_PEN = QPen(QColor("#c8ffd8"), 1.0)
+
     def __init__(
         self,
         node_id: str,
         node_type: str,
         x: float,
         y: float,
-        on_position_changed,
+        on_position_changed: Callable[[str], None],
         on_port_clicked: Callable[[str, str], None],
     ) -> None:
-        super().__init__(0, 0, 180, 70)
+        super().__init__(0, 0, DEFAULT_NODE_WIDTH, DEFAULT_NODE_HEIGHT)
         self.node_id = node_id
         self.node_type = node_type
         self.on_position_changed = on_position_changed
+        self._notify_move = on_position_changed is not None
+        self._anchor_cache: Optional[Tuple[QPointF, QPointF]] = None
         self.setPos(x, y)
 
-        self.setBrush(QBrush(QColor("#2d2d30")))
-        self.setPen(QPen(QColor("#8a8a8a"), 1.5))
+        self.setBrush(self.BRUSH)
+        self.setPen(self.PEN)
 
         self.setFlags(
             QGraphicsRectItem.ItemIsMovable
             | QGraphicsRectItem.ItemIsSelectable
             | QGraphicsRectItem.ItemSendsGeometryChanges
         )
+        self.setCacheMode(QGraphicsItem.DeviceCoordinateCache)
 
         label = QGraphicsSimpleTextItem(node_type, self)
-        label.setBrush(QBrush(QColor("#f0f0f0")))
+        label.setBrush(self.LABEL_BRUSH)
         label.setPos(12, 24)
+        label.setCacheMode(QGraphicsItem.DeviceCoordinateCache)
 
-        self.input_port = PortItem(-6, 28, 12, 12, node_id, "input", on_port_clicked, self)
-        self.input_port.setBrush(QBrush(QColor("#9cdcfe")))
-        self.input_port.setPen(QPen(QColor("#d0ebff"), 1.0))
+        self.input_port = PortItem(*self.INPUT_PORT_RECT.getRect(), node_id, "input", on_port_clicked, self)
+        self.input_port.setBrush(self.INPUT_PORT_BRUSH)
+        self.input_port.setPen(self.INPUT_PORT_PEN)
 
-        self.output_port = PortItem(174, 28, 12, 12, node_id, "output", on_port_clicked, self)
-        self.output_port.setBrush(QBrush(QColor("#6aeb8f")))
-        self.output_port.setPen(QPen(QColor("#c8ffd8"), 1.0))
+        self.output_port = PortItem(*self.OUTPUT_PORT_RECT.getRect(), node_id, "output", on_port_clicked, self)
+        self.output_port.setBrush(self.OUTPUT_PORT_BRUSH)
+        self.output_port.setPen(self.OUTPUT_PORT_PEN)
 
-    def input_anchor(self):
-        return self.mapToScene(0, 35)
+    def input_anchor(self) -> QPointF:
+        return self._scene_anchors()[0]
 
-    def output_anchor(self):
-        return self.mapToScene(180, 35)
+    def output_anchor(self) -> QPointF:
+        return self._scene_anchors()[1]
+
+    def _scene_anchors(self) -> Tuple[QPointF, QPointF]:
+        if self._anchor_cache is None:
+            self._anchor_cache = (self.mapToScene(self.INPUT_ANCHOR), self.mapToScene(self.OUTPUT_ANCHOR))
+        return self._anchor_cache
 
     def itemChange(self, change, value):
-        if change == QGraphicsRectItem.ItemPositionHasChanged and self.on_position_changed is not None:
-            self.on_position_changed()
+        if change == _POSITION_HAS_CHANGED:
+            self._anchor_cache = None
+            if self._notify_move:
+                self.on_position_changed(self.node_id)
+            return value
         return super().itemChange(change, value)
 
 
+class ConnectionLineItem(QGraphicsLineItem):
+    PEN = QPen(QColor("#53a7ff"), 2.0)
+
+    def __init__(self, start_item: NodeItem, end_item: NodeItem) -> None:
+        super().__init__()
+        self.start_item = start_item
+        self.end_item = end_item
+        self.setPen(self.PEN)
+        self.setZValue(-1)
+        self.update_position()
+
+    def update_position(self) -> None:
+        line = QLineF(self.start_item.output_anchor(), self.end_item.input_anchor())
+        if line != self.line():
+            self.setLine(line)
+
+
 class NodeEditorWindow(QMainWindow):
     def __init__(self, project_path: Path) -> None:
         super().__init__()
@@ -110,11 +172,25 @@ class NodeEditorWindow(QMainWindow):
         self.view.setRenderHints(self.view.renderHints())
         self.view.setDragMode(QGraphicsView.RubberBandDrag)
         self.view.setBackgroundBrush(QBrush(QColor("#1e1e1e")))
+        self.view.setOptimizationFlags(QGraphicsView.DontAdjustForAntialiasing | QGraphicsView.DontSavePainterState)
+        self.view.setViewportUpdateMode(QGraphicsView.SmartViewportUpdate)
 
         self.node_items: Dict[str, NodeItem] = {}
-        self.connections: List[Dict[str, str]] = []
-        self.connection_items: List[QGraphicsLineItem] = []
+        self.connections: List[Connection] = []
+        self.connection_items: List[ConnectionLineItem] = []
+        self._node_to_connections: Dict[str, List[ConnectionLineItem]] = {}
+        self._connection_keys: Set[Connection] = set()
+        self._occupied_inputs: Set[str] = set()
         self.pending_output_node_id: Optional[str] = None
+        self._graph_dirty = False
+        self._graph_fingerprint = 0
+        self._node_hashes: Dict[str, int] = {}
+        self._saved_fingerprint = 0
+
+        self.updated_node_ids: Set[str] = set()
+        self._connection_update_timer = QTimer(self)
+        self._connection_update_timer.setSingleShot(True)
+        self._connection_update_timer.timeout.connect(self._flush_connection_update)
 
         self._build_ui()
         self._connect_signals()
@@ -136,6 +212,9 @@ class NodeEditorWindow(QMainWindow):
         self.btn_add_input = QPushButton("Add Test Input Node")
         self.btn_add_process = QPushButton("Add Test Process Node")
         self.btn_add_output = QPushButton("Add Test Output Node")
+        self.btn_add_input.setProperty("node_type", "Test Input")
+        self.btn_add_process.setProperty("node_type", "Test Process")
+        self.btn_add_output.setProperty("node_type", "Test Output")
         self.btn_connect_selected = QPushButton("Connect Selected (Left -> Right)")
         self.btn_add_test_lines = QPushButton("Add Test Lines")
         self.btn_save_layout = QPushButton("Save Node Layout")
@@ -153,31 +232,36 @@ class NodeEditorWindow(QMainWindow):
         root.addWidget(self.view, stretch=4)
 
     def _connect_signals(self) -> None:
-        self.btn_add_input.clicked.connect(lambda: self.add_test_node("Test Input"))
-        self.btn_add_process.clicked.connect(lambda: self.add_test_node("Test Process"))
-        self.btn_add_output.clicked.connect(lambda: self.add_test_node("Test Output"))
+        for button in (self.btn_add_input, self.btn_add_process, self.btn_add_output):
+            button.clicked.connect(self._on_add_node_clicked)
         self.btn_connect_selected.clicked.connect(self.connect_selected_nodes)
         self.btn_add_test_lines.clicked.connect(self.add_test_lines)
         self.btn_save_layout.clicked.connect(self.save_layout)
 
+    def _on_add_node_clicked(self) -> None:
+        self.add_test_node(self.sender().property("node_type"))
+
     def _load_nodes_from_project(self) -> None:
         graph = load_project_graph(self.project_path)
         nodes = graph.get("nodes", [])
         connections = graph.get("connections", [])
 
+        self.scene.setItemIndexMethod(QGraphicsScene.NoIndex)
         for node in nodes:
             self._create_node_item(
-                node_id=str(node.get("id", uuid.uuid4())),
-                node_type=str(node.get("type", "Test Node")),
+                node_id=sys.intern(str(node.get("id", uuid.uuid4()))),
+                node_type=sys.intern(str(node.get("type", "Test Node"))),
                 x=float(node.get("x", 120.0)),
                 y=float(node.get("y", 120.0)),
             )
 
         self.connections = []
+        self._connection_keys = set()
+        self._occupied_inputs = set()
         for connection in connections:
-            from_node = str(connection.get("from_node", ""))
+            from_node = sys.intern(str(connection.get("from_node", "")))
             from_port = str(connection.get("from_port", "output"))
-            to_node = str(connection.get("to_node", ""))
+            to_node = sys.intern(str(connection.get("to_node", "")))
             to_port = str(connection.get("to_port", "input"))
             if (
                 from_node in self.node_items
@@ -186,16 +270,33 @@ class NodeEditorWindow(QMainWindow):
                 and from_port == "output"
                 and to_port == "input"
             ):
-                self.connections.append(
-                    {
-                        "from_node": from_node,
-                        "from_port": "output",
-                        "to_node": to_node,
-                        "to_port": "input",
-                    }
-                )
+                self._append_connection(Connection(from_node, "output", to_node, "input"))
 
         self._rebuild_connection_items()
+        self._grow_scene_rect(self.scene.itemsBoundingRect())
+        self.scene.setItemIndexMethod(QGraphicsScene.BspTreeIndex)
+        self.scene.setBspTreeDepth(SCENE_BSP_TREE_DEPTH)
+        self._saved_fingerprint = self._graph_fingerprint
+
+    def _update_node_fingerprint(self, node_id: str) -> None:
+        item = self.node_items[node_id]
+        pos = item.pos()
+        node_hash = hash((node_id, item.node_type, pos.x(), pos.y()))
+        self._graph_fingerprint ^= self._node_hashes.get(node_id, 0) ^ node_hash
+        self._node_hashes[node_id] = node_hash
+
+    def _graph_needs_save(self) -> bool:
+        self._flush_connection_update()
+        return self._graph_dirty and self._graph_fingerprint != self._saved_fingerprint
+
+    def _save_graph(self) -> None:
+        save_project_graph(
+            self.project_path,
+            self.collect_nodes(),
+            [connection._asdict() for connection in self.connections],
+        )
+        self._graph_dirty = False
+        self._saved_fingerprint = self._graph_fingerprint
 
     def _create_node_item(self, node_id: str, node_type: str, x: float, y: float) -> None:
         item = NodeItem(
@@ -208,65 +309,101 @@ class NodeEditorWindow(QMainWindow):
         )
         self.scene.addItem(item)
         self.node_items[node_id] = item
+        self._update_node_fingerprint(node_id)
 
     def add_test_node(self, node_type: str) -> None:
-        node_id = str(uuid.uuid4())
+        node_id = sys.intern(str(uuid.uuid4()))
         center_scene_pos = self.view.mapToScene(self.view.viewport().rect().center())
         x = float(center_scene_pos.x() - 90)
         y = float(center_scene_pos.y() - 35)
         self._create_node_item(node_id=node_id, node_type=node_type, x=x, y=y)
+        self._mark_graph_dirty()
+
+    def _mark_graph_dirty(self) -> None:
+        self._graph_dirty = True
 
     def _rebuild_connection_items(self) -> None:
         for line_item in self.connection_items:
             self.scene.removeItem(line_item)
         self.connection_items = []
+        self._node_to_connections = {}
 
         for connection in self.connections:
-            start_item = self.node_items.get(connection["from_node"])
-            end_item = self.node_items.get(connection["to_node"])
-            if start_item is None or end_item is None:
-                continue
+            self._create_connection_item(connection)
 
-            line = QLineF(start_item.output_anchor(), end_item.input_anchor())
-            line_item = self.scene.addLine(line, QPen(QColor("#53a7ff"), 2.0))
-            line_item.setZValue(-1)
-            self.connection_items.append(line_item)
+    def _create_connection_item(self, connection: Connection) -> None:
+        start_item = self.node_items.get(connection.from_node)
+        end_item = self.node_items.get(connection.to_node)
+        if start_item is None or end_item is None:
+            return
 
-    def update_connection_positions(self) -> None:
-        self._rebuild_connection_items()
+        line_item = ConnectionLineItem(start_item, end_item)
+        self.scene.addItem(line_item)
+        self.connection_items.append(line_item)
+        self._node_to_connections.setdefault(start_item.node_id, []).append(line_item)
+        self._node_to_connections.setdefault(end_item.node_id, []).append(line_item)
+
+    def update_connection_positions(self, node_id: str) -> None:
+        self._mark_graph_dirty()
+        self.updated_node_ids.add(node_id)
+
+        if not self._connection_update_timer.isActive():
+            self._connection_update_timer.start(0)
+
+    def _flush_connection_update(self) -> None:
+        if not self.updated_node_ids:
+            return
+
+        moved_ids = self.updated_node_ids
+        self.updated_node_ids = set()
+        touched_items: Set[ConnectionLineItem] = set()
+        moved_rect = QRectF()
+        for node_id in moved_ids:
+            self._update_node_fingerprint(node_id)
+            touched_items.update(self._node_to_connections.get(node_id, ()))
+            moved_rect = moved_rect.united(self.node_items[node_id].sceneBoundingRect())
+        for line_item in touched_items:
+            line_item.update_position()
+        self._grow_scene_rect(moved_rect)
+
+        self._connection_update_timer.start(CONNECTION_UPDATE_INTERVAL_MS)
+
+    def _grow_scene_rect(self, items_rect: QRectF) -> None:
+        scene_rect = self.scene.sceneRect()
+        if items_rect.isEmpty() or scene_rect.contains(items_rect):
+            return
+        grown = scene_rect.united(items_rect)
+        grown.adjust(
+            -SCENE_MARGIN if grown.left() < scene_rect.left() else 0.0,
+            -SCENE_MARGIN if grown.top() < scene_rect.top() else 0.0,
+            SCENE_MARGIN if grown.right() > scene_rect.right() else 0.0,
+            SCENE_MARGIN if grown.bottom() > scene_rect.bottom() else 0.0,
+        )
+        self.scene.setSceneRect(grown)
+
+    def _append_connection(self, connection: Connection) -> None:
+        self.connections.append(connection)
+        self._connection_keys.add(connection)
+        self._occupied_inputs.add(connection.to_node)
+        self._graph_fingerprint ^= hash(connection)
 
     def _input_is_available(self, to_node_id: str) -> bool:
-        for connection in self.connections:
-            if connection["to_node"] == to_node_id and connection["to_port"] == "input":
-                return False
-        return True
+        return to_node_id not in self._occupied_inputs
 
     def _add_connection(self, from_node_id: str, to_node_id: str) -> bool:
         if from_node_id == to_node_id:
             return False
 
-        exists = any(
-            connection
-            for connection in self.connections
-            if connection["from_node"] == from_node_id
-            and connection["from_port"] == "output"
-            and connection["to_node"] == to_node_id
-            and connection["to_port"] == "input"
-        )
-        if exists:
+        connection = Connection(from_node_id, "output", to_node_id, "input")
+        if connection in self._connection_keys:
             return False
 
         if not self._input_is_available(to_node_id):
             return False
 
-        self.connections.append(
-            {
-                "from_node": from_node_id,
-                "from_port": "output",
-                "to_node": to_node_id,
-                "to_port": "input",
-            }
-        )
+        self._append_connection(connection)
+        self._mark_graph_dirty()
+        self._create_connection_item(connection)
         return True
 
     def on_port_clicked(self, node_id: str, port_kind: str) -> None:
@@ -290,7 +427,6 @@ class NodeEditorWindow(QMainWindow):
                 return
 
             self.pending_output_node_id = None
-            self._rebuild_connection_items()
             self.statusBar().showMessage("Connection created.", 2500)
 
     def connect_selected_nodes(self) -> None:
@@ -311,8 +447,6 @@ class NodeEditorWindow(QMainWindow):
             )
             return
 
-        self._rebuild_connection_items()
-
     def add_test_lines(self) -> None:
         if len(self.node_items) < 2:
             return
@@ -323,8 +457,6 @@ class NodeEditorWindow(QMainWindow):
             to_id = ordered_nodes[index + 1].node_id
             self._add_connection(from_id, to_id)
 
-        self._rebuild_connection_items()
-
     def collect_nodes(self) -> List[Dict[str, object]]:
         result: List[Dict[str, object]] = []
         for node_id, item in self.node_items.items():
@@ -340,13 +472,13 @@ class NodeEditorWindow(QMainWindow):
         return result
 
     def save_layout(self) -> None:
-        nodes = self.collect_nodes()
-        save_project_graph(self.project_path, nodes, self.connections)
+        self._save_graph()
         QMessageBox.information(self, "Saved", "Project node locations saved.")
 
     def closeEvent(self, event) -> None:
-        try:
-            save_project_graph(self.project_path, self.collect_nodes(), self.connections)
-        except Exception:
-            pass
+        if self._graph_needs_save():
+            try:
+                self._save_graph()
+            except Exception:
+                pass
         super().closeEvent(event)
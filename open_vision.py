@@ -146,8 +146,11 @@ class OpenVisionMainWindow(QMainWindow):
         self.editor_window.show()
 
     def _select_project(self, project_path: Path) -> None:
+        # Callers only pass files from the Projects directory, which is where every
+        # entry in project_files comes from, so the file name identifies the project.
+        target_name = project_path.name
         for index, known_path in enumerate(self.project_files):
-            if known_path.resolve() == project_path.resolve():
+            if known_path.name == target_name:
                 self.projects_list.setCurrentRow(index)
                 break
 
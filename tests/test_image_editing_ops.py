@@ -10,11 +10,14 @@ from pathlib import Path
 from unittest.mock import Mock
 
 import pytest
+from PIL import Image
 
+from OV_Libs.ImageEditingLib import image_editing_ops
 from OV_Libs.ImageEditingLib.image_editing_ops import (
     extract_unique_colors,
     build_identity_mapping,
     apply_color_mapping,
+    find_colors_within_distance,
     save_images,
 )
 from OV_Libs.ImageEditingLib.image_models import ImageRecord
@@ -56,6 +59,17 @@ class TestExtractUniqueColors:
         # Verify sorted order
         assert result == sorted(result)
 
+    def test_real_rgba_image_matches_pixel_data(self):
+        """Should return the same sorted colors for a real RGBA image."""
+        image = Image.new("RGBA", (3, 2), (255, 0, 0, 255))
+        image.putpixel((0, 0), (0, 0, 255, 128))
+        image.putpixel((2, 1), (0, 255, 0, 255))
+
+        result = extract_unique_colors(image)
+
+        assert result == [(0, 0, 255, 128), (0, 255, 0, 255), (255, 0, 0, 255)]
+        assert all(isinstance(color, tuple) for color in result)
+
 
 class TestBuildIdentityMapping:
     """Tests for build_identity_mapping function."""
@@ -127,6 +141,90 @@ class TestApplyColorMapping:
         # Other colors should remain unchanged
         assert pixels[(1, 0)] == (0, 255, 0, 255)
 
+    def test_rgba_image_ignores_entries_that_are_not_rgba_colors(self):
+        """Should leave pixels alone for mapping keys that cannot match an RGBA pixel."""
+        image = Image.new("RGBA", (2, 1), (1, 2, 3, 255))
+        image.putpixel((1, 0), (7, 8, 9, 255))
+
+        result = apply_color_mapping(
+            image,
+            {
+                (1, 2, 3): (4, 5, 6),
+                (7, 8, 9, 300): (0, 0, 0, 255),
+                (7, 8, 9, 255): (10, 11, 12, 255),
+            },
+        )
+
+        assert result.getpixel((0, 0)) == (1, 2, 3, 255)
+        assert result.getpixel((1, 0)) == (10, 11, 12, 255)
+
+    @pytest.mark.parametrize("use_numpy", [True, False])
+    def test_integer_like_channels_map_the_same_with_and_without_numpy(self, monkeypatch, use_numpy):
+        """Should match NumPy integer and integral float channels the way the Pillow path does."""
+        np = pytest.importorskip("numpy")
+        if not use_numpy:
+            monkeypatch.setattr(image_editing_ops, "np", None)
+        image = Image.new("RGBA", (3, 1), (1, 2, 3, 255))
+        image.putpixel((1, 0), (7, 8, 9, 255))
+        image.putpixel((2, 0), (20, 21, 22, 255))
+
+        result = apply_color_mapping(
+            image,
+            {
+                (np.uint8(1), 2, 3, 255): (np.uint8(4), 5, 6, 255),
+                (7.0, 8, 9, 255): (10, 11, 12, 255),
+                (20.5, 21, 22, 255): (0, 0, 0, 255),
+            },
+        )
+
+        assert result.getpixel((0, 0)) == (4, 5, 6, 255)
+        assert result.getpixel((1, 0)) == (10, 11, 12, 255)
+        assert result.getpixel((2, 0)) == (20, 21, 22, 255)
+
+    def test_real_rgb_image_is_mapped_without_mutating_source(self):
+        """Should map pixels of a real non-RGBA image through the pixel-sequence path."""
+        image = Image.new("RGB", (2, 1), (255, 0, 0))
+        image.putpixel((1, 0), (0, 255, 0))
+
+        result = apply_color_mapping(image, {(255, 0, 0): (0, 0, 255)})
+
+        assert result.getpixel((0, 0)) == (0, 0, 255)
+        assert result.getpixel((1, 0)) == (0, 255, 0)
+        assert image.getpixel((0, 0)) == (255, 0, 0)
+
+    def test_real_rgba_image_is_mapped_without_mutating_source(self):
+        """Should map matching pixels of a real RGBA image into a new image."""
+        image = Image.new("RGBA", (2, 2), (255, 0, 0, 255))
+        image.putpixel((1, 1), (0, 255, 0, 255))
+
+        result = apply_color_mapping(image, {(255, 0, 0, 255): (0, 0, 255, 255), (1, 2, 3, 4): (5, 6, 7, 8)})
+
+        assert result.getpixel((0, 0)) == (0, 0, 255, 255)
+        assert result.getpixel((1, 1)) == (0, 255, 0, 255)
+        assert image.getpixel((0, 0)) == (255, 0, 0, 255)
+
+
+class TestFindColorsWithinDistance:
+    """Tests for find_colors_within_distance function."""
+
+    def test_returns_indices_within_tolerance(self):
+        """Should return indices of colors within the RGB distance, ignoring alpha."""
+        colors = [(0, 0, 0, 255), (255, 0, 0, 0), (240, 10, 0, 255), (200, 0, 0, 255)]
+
+        result = find_colors_within_distance(colors, (250, 0, 0, 255), 30)
+
+        assert result == [1, 2]
+
+    def test_includes_colors_exactly_at_tolerance(self):
+        """Should treat the tolerance as inclusive."""
+        result = find_colors_within_distance([(3, 4, 0, 255)], (0, 0, 0, 255), 5)
+
+        assert result == [0]
+
+    def test_empty_colors(self):
+        """Should return an empty list for no colors."""
+        assert find_colors_within_distance([], (0, 0, 0, 255), 30) == []
+
 
 class TestSaveImages:
     """Tests for save_images function."""
@@ -203,6 +301,22 @@ class TestSaveImages:
             call_kwargs = mock_image.save.call_args[1]
             assert call_kwargs.get('format') == 'PNG'
 
+    def test_writes_last_record_once_when_names_collide(self):
+        """Should write a shared output path once, using the last record."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            first = Mock()
+            last = Mock()
+            records = [
+                ImageRecord(path=Path("a/same.png"), original=first, modified=first),
+                ImageRecord(path=Path("b/same.png"), original=last, modified=last),
+            ]
+
+            count = save_images(records, Path(tmpdir))
+
+            assert count == 2
+            first.save.assert_not_called()
+            last.save.assert_called_once()
+
     def test_raises_error_for_nonexistent_directory(self):
         """Should raise OSError if output directory doesn't exist."""
         mock_image = Mock()
@@ -0,0 +1,135 @@
+"""
+GUI tests for the image editor window.
+
+Tests the bookkeeping that matches background color-mapping results
+to the apply request that started them.
+"""
+
+from pathlib import Path
+from unittest.mock import Mock
+
+import pytest
+
+pytest.importorskip("pytestqt")
+
+from PIL import Image
+from PyQt5.QtWidgets import QApplication
+
+from OV_Libs.ImageEditingLib import image_editor_window
+from OV_Libs.ImageEditingLib.image_editor_window import OpenVisionEditorWindow
+from OV_Libs.ImageEditingLib.image_models import ImageRecord
+
+RED = (255, 0, 0, 255)
+GREEN = (0, 255, 0, 255)
+BLUE = (0, 0, 255, 255)
+
+
+@pytest.fixture
+def started_tasks(monkeypatch):
+    """
+    Collect the runnables the window starts instead of running them on the thread pool.
+
+    Returns:
+        List the tests run from, in whatever order they need
+    """
+    tasks = []
+    thread_pool = Mock()
+    thread_pool.globalInstance.return_value.start = tasks.append
+    monkeypatch.setattr(image_editor_window, "QThreadPool", thread_pool)
+    return tasks
+
+
+@pytest.fixture
+def messages(monkeypatch):
+    """
+    Record info and warning dialogs instead of showing them.
+
+    Returns:
+        List of (title, message) tuples in the order they were shown
+    """
+    shown = []
+    monkeypatch.setattr(
+        OpenVisionEditorWindow, "_show_info", lambda self, title, message: shown.append((title, message))
+    )
+    monkeypatch.setattr(
+        image_editor_window.QMessageBox, "warning", lambda parent, title, message: shown.append((title, message))
+    )
+    return shown
+
+
+@pytest.fixture
+def window(qtbot):
+    """Provide an editor window holding two red images, the first one selected."""
+    editor = OpenVisionEditorWindow()
+    qtbot.addWidget(editor)
+    for name in ("a.png", "b.png"):
+        image = Image.new("RGBA", (2, 2), RED)
+        editor.images.append(ImageRecord(path=Path(name), original=image, modified=image))
+    editor.current_image_index = 0
+    return editor
+
+
+def _finish(task):
+    """Run a collected task and deliver its queued result signal."""
+    task.run()
+    QApplication.processEvents()
+
+
+class TestColorMappingResults:
+    """Tests for _on_color_mapping_finished and _on_color_mapping_failed."""
+
+    def test_stale_result_for_an_image_is_dropped(self, window, started_tasks, messages):
+        """Should keep the newest Apply to Current result when an older one arrives later."""
+        window.color_mappings = {RED: GREEN}
+        window.apply_to_current()
+        window.color_mappings = {RED: BLUE}
+        window.apply_to_current()
+
+        _finish(started_tasks[1])
+        _finish(started_tasks[0])
+
+        assert window.images[0].modified.getpixel((0, 0)) == BLUE
+        assert window._image_apply_requests == {}
+        assert messages == []
+
+    def test_apply_to_all_reports_success_once(self, window, started_tasks, messages):
+        """Should map every image and show the success message only after the last one."""
+        window.color_mappings = {RED: GREEN}
+        window.apply_to_all()
+
+        _finish(started_tasks[0])
+        assert messages == []
+        _finish(started_tasks[1])
+
+        assert [record.modified.getpixel((0, 0)) for record in window.images] == [GREEN, GREEN]
+        assert messages == [("Success", "Color mappings applied to all loaded images.")]
+        assert window._apply_all_request_id is None
+
+    def test_apply_to_current_during_apply_to_all(self, window, started_tasks, messages):
+        """Should keep the later Apply to Current result and still finish the batch once."""
+        window.color_mappings = {RED: GREEN}
+        window.apply_to_all()
+        window.color_mappings = {RED: BLUE}
+        window.apply_to_current()
+
+        _finish(started_tasks[2])
+        _finish(started_tasks[0])
+        _finish(started_tasks[1])
+
+        assert window.images[0].modified.getpixel((0, 0)) == BLUE
+        assert window.images[1].modified.getpixel((0, 0)) == GREEN
+        assert messages == [("Success", "Color mappings applied to all loaded images.")]
+
+    def test_failure_in_batch_is_reported_once(self, window, started_tasks, messages, monkeypatch):
+        """Should show one warning for a failing batch and no success message."""
+        monkeypatch.setattr(image_editor_window, "apply_color_mapping", Mock(side_effect=ValueError("bad mapping")))
+        window.color_mappings = {RED: GREEN}
+        window.apply_to_all()
+
+        for task in started_tasks:
+            _finish(task)
+
+        assert messages == [("Apply Failed", "bad mapping")]
+        assert window._apply_all_request_id is None
+        assert window._image_apply_requests == {}
+        assert all(record.modified is record.original for record in window.images)
@@ -0,0 +1,91 @@
+"""
+GUI tests for the node editor window.
+
+Tests the close-time save gate that skips writing the project file
+when the graph matches what was loaded or last saved.
+"""
+
+from unittest.mock import Mock
+
+import pytest
+
+pytest.importorskip("pytestqt")
+
+import node_editor_window
+from node_editor_window import NodeEditorWindow
+from OV_Libs.ProjStoreLib.project_store import create_project_file, save_project_graph
+
+
+@pytest.fixture
+def project_path(temp_project_dir):
+    """Provide a project file holding two unconnected nodes."""
+    path = create_project_file(temp_project_dir, "Save Gate")
+    save_project_graph(
+        path,
+        [
+            {"id": "first", "type": "Test Node", "x": 100.0, "y": 100.0},
+            {"id": "second", "type": "Test Node", "x": 400.0, "y": 100.0},
+        ],
+        [],
+    )
+    return path
+
+
+@pytest.fixture
+def saved_graphs(monkeypatch):
+    """
+    Spy on the window's project graph saves while still writing them.
+
+    Returns:
+        Mock wrapping save_project_graph
+    """
+    spy = Mock(wraps=save_project_graph)
+    monkeypatch.setattr(node_editor_window, "save_project_graph", spy)
+    return spy
+
+
+@pytest.fixture
+def window(qtbot, project_path):
+    """Provide a node editor window opened on the two-node project."""
+    editor = NodeEditorWindow(project_path)
+    qtbot.addWidget(editor)
+    return editor
+
+
+class TestCloseSaveGate:
+    """Tests for _graph_needs_save and the save on close."""
+
+    def test_move_and_move_back_skips_save(self, window, saved_graphs):
+        """Should not save when a node ends up where it was loaded."""
+        node = window.node_items["first"]
+        node.setPos(250.0, 180.0)
+        node.setPos(100.0, 100.0)
+
+        window.close()
+
+        saved_graphs.assert_not_called()
+
+    def test_real_move_saves(self, window, saved_graphs, project_path):
+        """Should save the new position when a node was moved."""
+        window.node_items["first"].setPos(250.0, 180.0)
+
+        window.close()
+
+        saved_graphs.assert_called_once()
+        reopened = NodeEditorWindow(project_path)
+        position = reopened.node_items["first"].pos()
+        reopened.close()
+        assert (position.x(), position.y()) == (250.0, 180.0)
+
+    def test_new_connection_saves(self, window, saved_graphs):
+        """Should save when a connection was added without moving any node."""
+        window.on_port_clicked("first", "output")
+        window.on_port_clicked("second", "input")
+
+        assert window._graph_needs_save()
+        window.close()
+
+        saved_graphs.assert_called_once()
+        assert saved_graphs.call_args[0][2] == [
+            {"from_node": "first", "from_port": "output", "to_node": "second", "to_port": "input"}
+        ]
@@ -20,6 +20,24 @@ class TestNodeGraphBuilder(unittest.TestCase):
         self.assertEqual(node["linked_inputs"], [None, None, None])
         self.assertEqual(node["linked_outputs"], [[], []])
 
+    def test_returned_nodes_are_independent_copies(self):
+        builder = NodeGraphBuilder()
+        builder.add_node("src", "Input", input_count=0, output_count=1, settings={"radius": 2})
+        builder.add_node("dst", "Output", input_count=1, output_count=0)
+        builder.connect("src", "dst")
+
+        nodes = builder.get_nodes()
+        nodes[0]["linked_outputs"][0].append("other")
+        nodes[0]["settings"]["radius"] = 9
+        nodes[1]["linked_inputs"][0] = None
+        builder.get_connections()[0]["to_node"] = "other"
+
+        fresh = builder.get_nodes()
+        self.assertEqual(fresh[0]["linked_outputs"], [["dst"]])
+        self.assertEqual(fresh[0]["settings"], {"radius": 2})
+        self.assertEqual(fresh[1]["linked_inputs"], ["src"])
+        self.assertEqual(builder.get_connections()[0]["to_node"], "dst")
+
     def test_connect_enforces_single_input_slot(self):
         builder = NodeGraphBuilder()
         builder.add_node("a", "Input", input_count=0, output_count=1)
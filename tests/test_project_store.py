@@ -159,6 +159,34 @@ class TestLoadProjectName:
             
             assert name == "invalid"
 
+    def test_loads_escaped_project_name(self):
+        """Should fall back to a full parse for names with escaped characters."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            base_dir = Path(tmpdir)
+            expected_name = 'Quoted "Project" \\ Name'
+
+            project_path = create_project_file(base_dir, expected_name)
+
+            assert load_project_name(project_path) == expected_name
+
+    def test_ignores_nested_name_before_top_level_name(self):
+        """Should return the top-level name even when a nested "name" key comes first."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            project_file = Path(tmpdir) / "nested.ovproj"
+            project_file.write_text(
+                json.dumps({"filter_stacks": {"img": [{"name": "Blur"}]}, "name": "Real Project"})
+            )
+
+            assert load_project_name(project_file) == "Real Project"
+
+    def test_returns_stem_for_truncated_file(self):
+        """Should not trust a name read from a truncated project file."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            broken_file = Path(tmpdir) / "broken.ovproj"
+            broken_file.write_text('{"name": "Broken", ')
+
+            assert load_project_name(broken_file) == "broken"
+
 
 class TestLoadProjectData:
     """Tests for load_project_data function."""